@@ -188,6 +188,7 @@
 
 
 from __future__ import unicode_literals, print_function, division
+import random
 from lingpy import *
 
 # load the wordlist
@@ -317,18 +318,28 @@ print(len(errors))
 # 
 # For cognate detection, it is not only important to have good phonetic transcriptions (ideally segmented in such a form that they were checked by an experienced linguist), but also to make sure that there are **enough words** in your data. If the data is too sparse, even human linguists would not be able to find any signal based on regular sound correspondences, provided they see the languages the first time and don't know their history (which is the situation for every algorithm). Following an earlier study by [List (2014b)](http://bibliography.lingpy.org?key=List2014c), we know now that at least 100 word pairs for languages as disparate as English and French are needed to provide a solid basis for automatic cognate detection. But when dealing with a large dataset of different languages, which necessarily contains a number of gaps (not all concepts can be elicited in the sources, field work has not provided enough details, etc.), it can be deleterious if the *mutual coverage* between the languages is low. 
 # 
-# By mutual coverage, I mean the number of comparable word pairs (with the same concept) for each language pair in a given dataset. We can compare different aspects of mutual coverage, such as the *average mutual coverage*, where we average the number of available word pairs, or the *minimal mutual coverage*, which provides the smallest mutual coverage of any pair of languages. In addition, one can also ask for the subset fulfilling a minimal mutual coverage for all language pairs, and this task would return the subset of languages in a `Wordlist` which all have at least the mutual coverage specified by the user. LingPy offers now (since version 2.5.1, see also the [online reference](http://lingpy.org/docu/compare/sanity.html)) solutions for all these problems, but since the last problem is considerably hard and computationally intensive, we won't discuss it here, but will instead simply check the minimal mutual coverage which holds for all languages in our sample. So we try to find the lower bound of concept pairs which all languages have in common.
+# By mutual coverage, I mean the number of comparable word pairs (with the same concept) for each language pair in a given dataset. We can compare different aspects of mutual coverage, such as the *average mutual coverage*, where we average the number of available word pairs, or the *minimal mutual coverage*, which provides the smallest mutual coverage of any pair of languages. In addition, one can also ask for the subset fulfilling a minimal mutual coverage for all language pairs, and this task would return the subset of languages in a `Wordlist` which all have at least the mutual coverage specified by the user. LingPy offers now (since version 2.5.1, see also the [online reference](http://lingpy.org/docu/compare/sanity.html)) solutions for all these problems, but since the last problem is considerably hard and computationally intensive, we won't discuss it here, but will instead simply check the minimal mutual coverage which holds for all languages in our sample. So we try to find the lower bound of concept pairs which all languages have in common. For this, we use `mutual_coverage_check`, which tells us whether all language pairs share at least a given number of concepts. Since each call computes the coverage for all language pairs anew, we do not test one threshold after another, but search for the lower bound by bisection, which needs only a handful of calls:
 
 # In[8]:
 
 
 from lingpy.compare.util import (
     mutual_coverage_check, mutual_coverage_subset)
-for i in range(210, 0, -1):
-    if mutual_coverage_check(wl, i):
-        print(
-            "Minimal mutual coverage is at {0} concept pairs.".format(i))
-        break
+
+def minimal_mutual_coverage(wordlist):
+    # if the coverage holds for a threshold, it also holds for all lower ones
+    lower, upper = 0, wordlist.height
+    while lower < upper:
+        middle = (lower + upper + 1) // 2
+        if mutual_coverage_check(wordlist, middle):
+            lower = middle
+        else:
+            upper = middle - 1
+    return lower
+
+print(
+    "Minimal mutual coverage is at {0} concept pairs.".format(
+        minimal_mutual_coverage(wl)))
 
 
 # This value is definitely good enough for our purpose, given the rule of thumb which says that below a minimal mutual coverage of 100 one should not do language-specific cognate detection analyses. If the coverage is lower, this does not mean you need to give up automatic cognate detection, but it means you should not use the language-specific `LexStat` method but rather a language-independent method, which does not require the information on potential sound correspondences (but will also tend to identify more false positives).
@@ -344,13 +355,13 @@ print('{0:.2f}'.format(average_coverage(wl)))
 
 # This value is in fact quite high, since we know that many other datasets that have been used in the past to test automatic cognate detection methods had a considerable amount of missing data and would therefore have an AMC score much lower than 0.8.
 # 
-# Although, as we just said, the value is good enough, we should further reduce the data a bit to make sure we can inspect them better later on (otherwise, the analyses may also take a lot of time if you run them on computers with insufficient power). So what we will do right now is testing the `mutual_coverage_subset` method which returns a subset of languages for which a given minimal mutual coverage holds. We will then export our `Wordlist` object to file by specifying these languages as our subset:
+# Although, as we just said, the value is good enough, we should further reduce the data a bit to make sure we can inspect them better later on (otherwise, the analyses may also take a lot of time if you run them on computers with insufficient power). So what we will do right now is testing the `mutual_coverage_subset` method which returns a subset of languages for which a given minimal mutual coverage holds. We will then export our `Wordlist` object to file by specifying these languages as our subset. Our data contains three different subsets of 13 languages with the same average mutual coverage, and the order in which LingPy returns them depends on the way Python hashes strings, which changes from one run to another. We therefore sort the results to make sure that we always select the same subset:
 
 # In[10]:
 
 
 count, results = mutual_coverage_subset(wl, 200)
-coverage, languages = results[0]
+coverage, languages = sorted(results)[0]
 print(
     'Found {0} languages with an average mutual coverage of {1}.'.format(
         count, coverage))
@@ -391,11 +402,8 @@ print(
 # In[12]:
 
 
-for i in range(210, 0, -1):
-    if mutual_coverage_check(wl, i):
-        print("Minimal mutual coverage is at {0} concept pairs (AMC: {1:.2f}).".format(
-            i, average_coverage(wl)))
-        break
+print("Minimal mutual coverage is at {0} concept pairs (AMC: {1:.2f}).".format(
+    minimal_mutual_coverage(wl), average_coverage(wl)))
 
 
 # Note that this coverage is much less than the coverage we encountered above. Nevertheless, for our purpose it will be good enough, and the rule of thumb for closely related languages, which says, that we need more than 150 concepts mutually shared between each language pair holds.
@@ -654,11 +662,13 @@ for k, v in eight.items():
         lex[idx, 'scaid']))
 
 
-# We are now ready to do the same analysis with the "lexstat" method. This will take some time due to the permutation test. In order to make sure we do not need to run this all the time, we will save the data immediately after running the permutation to a file which we give the extension "bin.tsv", and which we can load in case we want to carry out further tests, or which we can otherwise also share when publishing results, as it contains all the data needed to rerun the analyses on a different machine. LingPy creates a lot of data when analyzing wordlists, but by default, only a minimal amount of the data is written to file. In this case, if we want to store the results of the permutation test, we need to store the whole file with all the data that lingpy produces, especially the language-specific scoring function. In order to force LingPy to do so, we have to add the keyword ```ignore=[]``` to the output-function. This will prevent that any data which should be written to file is ignored:
+# We are now ready to do the same analysis with the "lexstat" method. This will take some time due to the permutation test. The number of permutations is set with the keyword `runs`, which defaults to 1000 in LingPy. We use 10000 runs here, which is the most time-consuming step of the whole tutorial, so if you only want to quickly try out the code, you can safely lower this value, keeping in mind that the resulting scores will then be less stable. In order to make sure we do not need to run this all the time, we will save the data immediately after running the permutation to a file which we give the extension "bin.tsv", and which we can load in case we want to carry out further tests, or which we can otherwise also share when publishing results, as it contains all the data needed to rerun the analyses on a different machine. LingPy creates a lot of data when analyzing wordlists, but by default, only a minimal amount of the data is written to file. In this case, if we want to store the results of the permutation test, we need to store the whole file with all the data that lingpy produces, especially the language-specific scoring function. In order to force LingPy to do so, we have to add the keyword ```ignore=[]``` to the output-function. This will prevent that any data which should be written to file is ignored:
 
 # In[27]:
 
 
+# seed the random number generator to make the permutation test reproducible
+random.seed(1234)
 lex.get_scorer(runs=10000)
 lex.output('tsv', filename='east-polynesian.bin', ignore=[])
 lex.cluster(method='lexstat', threshold=0.60, ref='lexstatid')
@@ -718,7 +728,7 @@ alm.align(method='progressive', scoredict=lex.cscorer)
 
 # This was not very spectacular, as we have not yet seen what happened. We can visualize the alignments from the command line by picking a particular cognate set and printing the alignments on screen. The alignments are added in a specific column called `alignments` as a default (but which can be modified by specifying another value with the keyword `alignments` passed to the initialization method for the `Alignments` class). Additionally, they can be retrieved using the `Alignments.get_msa` method - since multiple different alignment analyses can be stored in the object, the reference to a particular analysis must be passed. The following code illustrates how we can print a particular aligned cognate set:
 
-# In[32]:
+# In[31]:
 
 
 msa = alm.get_msa('infomap')[1]
@@ -734,7 +744,7 @@ for i, idx in enumerate(msa['ID']):
 
 # Again the eight, although this was not planned. But now let's quickly save the data to file, so that we can go on and inspect the findings further:
 
-# In[33]:
+# In[32]:
 
 
 alm.output('tsv', filename='east-polynesian-aligned', ignore='all', prettify=False)
@@ -760,7 +770,7 @@ alm.output('tsv', filename='east-polynesian-aligned', ignore='all', prettify=Fal
 # 
 # If you want to manually inspect the differences after having computed automatic cognates, you can write data in LingPy to a textfile which easily contrasts the differences between experts' cognate judgments and automatic cognates.
 
-# In[34]:
+# In[33]:
 
 
 from lingpy.evaluate.acd import diff
@@ -805,7 +815,7 @@ out
 # 
 # Let's start and do this comparison now, by loading the respective functions from the LingPy evaluation module, and computing precision, recall, and f-scores for all our different automatically inferred cognate sets with respect to the gold standard. The gold standard is located in the column `COGID` of the input file, so we need to name this when comparing with any of the other columns (like `LEXSTATID`, etc.).
 
-# In[35]:
+# In[34]:
 
 
 from lingpy.evaluate.acd import bcubes
@@ -819,7 +829,7 @@ for res in ['turchinid', 'editid', 'scaid', 'lexstatid', 'infomap']:
     ))
 
 
-# You can see, that the "infomap" method is, in fact, working slightly better than the normal "lexstat" method, and you can also see how deep the difference between the correspondence-informed methods and the other methods is.
+# You can see that the two correspondence-informed methods, "lexstat" and "infomap", perform very similarly, with "lexstat" being slightly better in this run. Since both methods depend on the random permutation test carried out by `get_scorer` (and "infomap" also makes random decisions during clustering), their ranking may change if you use a different seed or a different number of runs. What you can also see is how deep the difference between the correspondence-informed methods and the other methods is.
 
 # ## 6 Exporting Data
 # 
@@ -829,7 +839,7 @@ for res in ['turchinid', 'editid', 'scaid', 'lexstatid', 'infomap']:
 # 
 # Nexus export is straightforward in LingPy, and currently, two formats, MrBayes and BEAST are supported. The following code will export our latest wordlist to Nexus in MrBayes format, using the expert cognate judgments for export:
 
-# In[36]:
+# In[35]:
 
 
 from lingpy.convert.strings import write_nexus
@@ -838,7 +848,7 @@ nexus = write_nexus(wl, ref='cogid', mode='mrbayes', filename='east-polynesian-m
 
 # If you want to export the automatic cognate judgments to BEAST nexus format, you can do so by changing the "mode" keyword and the "ref" keyword:
 
-# In[37]:
+# In[36]:
 
 
 nexus = write_nexus(wl, ref="lexstatid", mode="beast", filename='east-polynesian-beast.nex')
@@ -846,7 +856,7 @@ nexus = write_nexus(wl, ref="lexstatid", mode="beast", filename='east-polynesian
 
 # Finally, if you want BEAST to use concept-specific rates instead of general rates for all data, you can do so selecting "beastwords" as your mode of choice:
 
-# In[38]:
+# In[37]:
 
 
 nexus = write_nexus(wl, ref="lexstatid", mode="beastwords", filename="east-polynesian-beastw.nex")
@@ -856,7 +866,7 @@ nexus = write_nexus(wl, ref="lexstatid", mode="beastwords", filename="east-polyn
 
 # You can also calculate distances which would be interesting for packages like SplitsTree (Huson 1998), or also Phylip ([Felsenstein 2005](http://bibliography.lingpy.org?key=Felsenstein2005). For this, you need to be careful, however, since distances can be computed in different ways, and you can choose from a multitude of different distances, and they are not (yet) all documented. The distance calculation as a default counts, how many cognates there are for all concepts between each language pair, so in some way, this tries to mimick Swadesh's original idea of distances or similarities between languages:
 
-# In[39]:
+# In[38]:
 
 
 import io
@@ -873,13 +883,14 @@ print(dst)
 # 
 # As a final experiment, let us create a tree from the distances, using the simple Neighbor-Joining algorithm, and then print this tree to screen.
 
-# In[40]:
+# In[39]:
 
 
 tree = Tree(wl.get_tree(ref='infomap', tree_calc='upgma', force=True))
 print(tree.asciiArt())
 
 
+
 # It is not up to me to judge how good this tree is, and it may also be wrongly rooted in the display. But you can see that LingPy can also handle classical tree formats. Although we do not plan to make LingPy a concurrence for tree inference packages, we find it useful to offer Neighbor-joining and UPGMA just to make it easier for users to quickly evaluate their analyses.
 # 
 # 
@@ -891,7 +902,7 @@ print(tree.asciiArt())
 # 
 # The Cross-Linguistic Data Formats initiative ([Forkel et al. 2017](http://bibliography.lingpy.org?key=Forkel2017a)) provides standardized formats for the sharing of data amenable for cross-linguistic comparison. LingPy now also offers the possibility to export to CLDF as well as to read CLDF files. Since CLDF is more explicit and powerful than LingPy's file-formats, you can add additional data, like your sources in form of BibTex files. We have prepared a BibTex file along with this tutorial and pass it to the algorithm, so that it becomes included into the CLDF-package:
 
-# In[41]:
+# In[40]:
 
 
 from lingpy.convert.cldf import to_cldf
@@ -901,7 +912,7 @@ to_cldf(wl, path='cldf', source_path='polynesian.bib', source='source', form='fo
 
 # Once the data has been exported, you can easily import it back, using the ```from_cldf``` function. Just make sure to specify the metadata file in JSON format as the path:
 
-# In[42]:
+# In[41]:
 
 
 wl = from_cldf("cldf/Wordlist-metadata.json")